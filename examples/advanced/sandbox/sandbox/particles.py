@@ -8,6 +8,17 @@ from batgrl.colors import Color
 
 random = np.random.default_rng().random
 
+NEIGHBOR_DELTAS = (
+    (-1, -1),
+    (-1, 0),
+    (-1, 1),
+    (0, -1),
+    (0, 1),
+    (1, -1),
+    (1, 0),
+    (1, 1),
+)
+
 
 class State(Enum):
     """Element states."""
@@ -30,6 +41,7 @@ class CycleColorBehavior:
 
     def step(self):
         self.COLOR = next(self.COLORS)
+        self.colors[self.pos] = self.COLOR
         super().step()
 
 
@@ -37,12 +49,34 @@ class ColorVariationBehavior:
     """Adds a small variation to the element color."""
 
     def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
         random_delta = 10 * random(3) - 5  # Three random values between -5 and 5
         random_color = np.clip(
             random_delta + self.COLOR, 0, 255, dtype=np.uint8, casting="unsafe"
         )
         self.COLOR = Color(*random_color)
+        super().__init__(*args, **kwargs)
+
+
+def neighbors_at(world, pos):
+    """Yield the positions and elements of all neighbors of `pos`."""
+    h, w = world.shape
+    y, x = pos
+    for dy, dx in NEIGHBOR_DELTAS:
+        if 0 <= y + dy < h and 0 <= x + dx < w:
+            yield (y + dy, x + dx), world[y + dy, x + dx]
+
+
+def wake_neighbors_at(world, pos):
+    """Wake all neighbors of `pos`."""
+    for _, neighbor in neighbors_at(world, pos):
+        neighbor.wake()
+
+
+def place(world, colors, pos, element):
+    """Stop the element at `pos` from updating and replace it with `element`."""
+    world[pos].sleep()
+    wake_neighbors_at(world, pos)
+    element(world, colors, pos)
 
 
 class Element(ABC):
@@ -68,17 +102,21 @@ class Element(ABC):
         ):
             cls.all_elements[cls.__name__] = cls
 
-    def __init__(self, world, pos):
+    def __init__(self, world, colors, pos):
         self.world = world
+        self.colors = colors
         self.pos = pos
-        self.world[pos] = self
+        world[pos] = self
+        colors[pos] = self.COLOR
         self.inactivity = 0
-        self._update_task = asyncio.create_task(self.update())
+        self._update_task = None
+        self.wake()
 
     def sleep(self):
         """Stop updating."""
         self.inactivity = 0
-        self._update_task.cancel()
+        if self._update_task is not None:
+            self._update_task.cancel()
 
     def sleep_if_inactive(self):
         """
@@ -92,14 +130,17 @@ class Element(ABC):
 
     def wake(self):
         """Resume updating."""
-        if self._update_task.done():
+        if self._update_task is None or self._update_task.done():
             self._update_task = asyncio.create_task(self.update())
 
     def replace(self, element=None):
         """Stop updating and replace with element or DEFAULT_REPLACEMENT or Air."""
-        self.sleep()
-        self.wake_neighbors()
-        (element or self.DEFAULT_REPLACEMENT or Air)(self.world, self.pos)
+        place(
+            self.world,
+            self.colors,
+            self.pos,
+            element or self.DEFAULT_REPLACEMENT or Air,
+        )
 
     async def update(self):
         """Coroutine that steps the element."""
@@ -115,43 +156,22 @@ class Element(ABC):
 
             await asyncio.sleep(self.SLEEP)
 
-    def neighbors(self):
-        """Yield all neighbors."""
-        world = self.world
-        h, w = world.shape
-        y, x = self.pos
-        deltas = (
-            (-1, -1),
-            (-1, 0),
-            (-1, 1),
-            (0, -1),
-            (0, 1),
-            (1, -1),
-            (1, 0),
-            (1, 1),
-        )
-
-        for dy, dx in deltas:
-            if 0 <= y + dy < h and 0 <= x + dx < w:
-                yield world[y + dy, x + dx]
-
     def wake_neighbors(self):
         """Wake all neighbors."""
-        for neighbor in self.neighbors():
-            neighbor.wake()
+        wake_neighbors_at(self.world, self.pos)
 
     def update_neighbors(self):
         """Update all neighbors or until `update_neighbor` returns true."""
-        for neighbor in self.neighbors():
-            if self.update_neighbor(neighbor):
+        for pos, neighbor in neighbors_at(self.world, self.pos):
+            if self.update_neighbor(neighbor, pos):
                 return True
 
         return False
 
     @abstractmethod
-    def update_neighbor(self, neighbor):
+    def update_neighbor(self, neighbor, pos):
         """
-        Update neighbor.
+        Update neighbor at `pos`.
 
         Return true to stop updating.
         """
@@ -164,12 +184,14 @@ class Element(ABC):
 class InertElement(Element):
     """Base for inert elements."""
 
-    def update_neighbor(self, neighbor):
+    def wake(self):
+        """Never update; inert elements don't need an update task."""
+
+    def update_neighbor(self, neighbor, pos):
         """Do nothing."""
 
     def step(self):
-        """Cancel updating."""
-        self._update_task.cancel()
+        """Do nothing."""
 
 
 class MovingElement(Element):
@@ -205,16 +227,21 @@ class MovingElement(Element):
 
         # Swap position with neighbor
         self.wake_neighbors()
-        neighbor.wake_neighbors()
+        wake_neighbors_at(world, (new_y, new_x))
+
+        colors = self.colors
 
-        neighbor.pos = y, x
+        if neighbor is not AIR:
+            neighbor.pos = y, x
         world[y, x] = neighbor
+        colors[y, x] = neighbor.COLOR
 
         self.pos = new_y, new_x
         world[new_y, new_x] = self
+        colors[new_y, new_x] = self.COLOR
         return True
 
-    def update_neighbor(self, neighbor):
+    def update_neighbor(self, neighbor, pos):
         """Return ``False``."""
         return False
 
@@ -241,10 +268,36 @@ class MovingElement(Element):
 
 
 class Air(InertElement):
+    """
+    Empty space.
+
+    Air has no state of its own, so a single instance, `AIR`, fills every empty cell
+    of a world.
+    """
+
     COLOR = Color(25, 25, 25)
     DENSITY = 0.0
     STATE = State.GAS
 
+    def __new__(cls, world, colors, pos):
+        return AIR
+
+    def __init__(self, world, colors, pos):
+        world[pos] = self
+        colors[pos] = self.COLOR
+
+    def sleep(self):
+        """Do nothing."""
+
+    @classmethod
+    def fill(cls, world, colors):
+        """Fill world with air."""
+        world.fill(AIR)
+        colors[:] = cls.COLOR
+
+
+AIR = object.__new__(Air)
+
 
 class Stone(ColorVariationBehavior, InertElement):
     COLOR = Color(120, 110, 120)
@@ -282,7 +335,7 @@ class Snow(ColorVariationBehavior, MovingElement):
         if dx != 0:  # Not allowing snow to move directly down so it meanders more.
             return super()._move(dy, dx)
 
-    def update_neighbor(self, neighbor):
+    def update_neighbor(self, neighbor, pos):
         if self.MELT_TIME == float("inf") and isinstance(neighbor, Water):
             self.MELT_TIME = (
                 30 * random()
@@ -327,7 +380,7 @@ class Fire(CycleColorBehavior, MovingElement):
     DENSITY = 0.1
     STATE = State.SOLID
 
-    def update_neighbor(self, neighbor):
+    def update_neighbor(self, neighbor, pos):
         match neighbor:
             case Wood():
                 if random() > 0.99:
@@ -338,7 +391,7 @@ class Fire(CycleColorBehavior, MovingElement):
                 return True
             case Air():
                 if random() > 0.989:
-                    neighbor.replace(Smoke)
+                    place(self.world, self.colors, pos, Smoke)
             case Water():
                 if random() > 0.95:
                     neighbor.replace(Steam)
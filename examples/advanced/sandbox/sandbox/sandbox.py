@@ -1,18 +1,10 @@
-from functools import partial
-
 import numpy as np
 from batgrl.colors import ABLACK
 from batgrl.gadgets.graphics import Graphics, Size
 from batgrl.gadgets.text import Text, new_cell
 
 from .element_buttons import MENU_BACKGROUND_COLOR, ButtonContainer
-from .particles import Air
-
-
-@partial(np.vectorize, otypes=[np.uint8, np.uint8, np.uint8])
-def particles_to_colors(particle):
-    """Convert array of particles to array of colors."""
-    return particle.COLOR
+from .particles import Air, place
 
 
 class Sandbox(Graphics):
@@ -27,9 +19,10 @@ class Sandbox(Graphics):
         super().on_add()
         # Build array of particles -- Initially all Air
         self.world = world = np.full((2 * self.height, self.width), None, dtype=object)
-        for y in range(2 * self.height):
-            for x in range(self.width):
-                world[y, x] = Air(world, (y, x))
+        # Particles write their colors into `colors` as they are placed, move, or
+        # change color.
+        self.colors = colors = np.empty((2 * self.height, self.width, 3), np.uint8)
+        Air.fill(world, colors)
 
         self.display = Text(
             size=(1, 9),
@@ -48,8 +41,7 @@ class Sandbox(Graphics):
             particle.sleep()
 
     def _render(self, canvas):
-        # Color of each particle in `self.world` is written into color array.
-        self.texture[..., :3] = np.dstack(particles_to_colors(self.world))
+        self.texture[..., :3] = self.colors
         super()._render(canvas)
 
     def on_mouse(self, mouse_event):
@@ -57,10 +49,11 @@ class Sandbox(Graphics):
             return
 
         world = self.world
+        colors = self.colors
         particle_type = self.particle_type
         y, x = self.to_local(mouse_event.pos)
 
-        world[2 * y, x].replace(particle_type)
-        world[2 * y + 1, x].replace(particle_type)
+        place(world, colors, (2 * y, x), particle_type)
+        place(world, colors, (2 * y + 1, x), particle_type)
 
         return True
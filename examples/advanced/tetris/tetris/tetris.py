@@ -51,6 +51,7 @@ class Piece(Graphics):
     @tetromino.setter
     def tetromino(self, new_tetromino):
         self._tetromino = new_tetromino
+        self._orientation = None
         self.is_enabled = True
         self.orientation = Orientation.UP
 
@@ -60,6 +61,9 @@ class Piece(Graphics):
 
     @orientation.setter
     def orientation(self, orientation):
+        if orientation == self._orientation:
+            return
+
         self._orientation = orientation
         h, w, _ = self._tetromino.textures[orientation].shape
         self.texture = self._tetromino.textures[self._orientation]
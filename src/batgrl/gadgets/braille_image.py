@@ -174,7 +174,10 @@ class BrailleImage(Gadget):
             is_enabled=is_enabled,
         )
         self.add_gadget(self._image)
-        self.path = path
+        # Read the image without loading the texture; `on_size` sizes the image
+        # canvas and loads the texture once.
+        self._read_path(path)
+        self.on_size()
         self.alpha = alpha
 
     @property
@@ -202,13 +205,18 @@ class BrailleImage(Gadget):
 
     @path.setter
     def path(self, path: Path | None):
+        self._read_path(path)
+        self._load_texture()
+
+    def _read_path(self, path: Path | None):
         self._path: Path | None = path
 
         if path is None:
             self._otexture = np.zeros((1, 1, 3), dtype=np.uint8)
         else:
-            self._otexture = cv2.imread(str(path.absolute()), cv2.IMREAD_COLOR)
-        self._load_texture()
+            self._otexture = cv2.cvtColor(
+                cv2.imread(str(path.absolute()), cv2.IMREAD_COLOR), cv2.COLOR_BGR2RGB
+            )
 
     def on_size(self):
         """Resize canvas and colors arrays."""
@@ -221,9 +229,9 @@ class BrailleImage(Gadget):
             return
 
         canvas = self._image.canvas
-        img_bgr = cv2.resize(self._otexture, (2 * w, 4 * h))
-        img_rgb = cv2.cvtColor(img_bgr, cv2.COLOR_BGR2RGB)
-        img_hls = cv2.cvtColor(img_bgr, cv2.COLOR_BGR2HLS)
+        # Texture was converted to RGB once on load.
+        img_rgb = cv2.resize(self._otexture, (2 * w, 4 * h))
+        img_hls = cv2.cvtColor(img_rgb, cv2.COLOR_RGB2HLS)
 
         rgb_sectioned = np.swapaxes(img_rgb.reshape(h, 4, w, 2, 3), 1, 2)
         hls_sectioned = np.swapaxes(img_hls.reshape(h, 4, w, 2, 3), 1, 2)
@@ -245,10 +253,9 @@ class BrailleImage(Gadget):
         ndots[ndots == 0] = 1
         ndots_neg[ndots_neg == 0] = 1
 
-        foreground = rgb_sectioned.copy()
-        foreground[~where_dots] = 0
-        canvas["fg_color"] = foreground.sum(axis=(2, 3)) / ndots[..., None]
-
-        background = rgb_sectioned.copy()
-        background[where_dots] = 0
-        canvas["bg_color"] = background.sum(axis=(2, 3)) / ndots_neg[..., None]
+        # The background sum is what's left of the total after the foreground sum,
+        # so the sections are only masked once.
+        foreground = (rgb_sectioned * where_dots[..., None]).sum(axis=(2, 3))
+        background = rgb_sectioned.sum(axis=(2, 3)) - foreground
+        canvas["fg_color"] = foreground / ndots[..., None]
+        canvas["bg_color"] = background / ndots_neg[..., None]
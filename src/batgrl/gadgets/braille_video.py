@@ -319,9 +319,11 @@ class BrailleVideo(Gadget):
         canvas["char"] = binary_to_braille(sectioned)
 
         if self.enable_shading:
-            normals = cv2.resize(self._current_frame, (w, h)) / 255
-            shades = lerp(self.bg_color, self.fg_color, normals[..., None])
-            canvas["fg_color"] = shades.astype(np.uint8)
+            # Shade with a lookup table of all 256 gray levels instead of
+            # interpolating colors in float64 for every cell.
+            normals = np.arange(256)[:, None] / 255
+            shades = lerp(self.bg_color, self.fg_color, normals).astype(np.uint8)
+            canvas["fg_color"] = shades[cv2.resize(self._current_frame, (w, h))]
         else:
             canvas["fg_color"] = self.fg_color
 
@@ -1,7 +1,9 @@
 """A file chooser gadget."""
 
+import os
 import platform
 from collections.abc import Callable
+from functools import lru_cache
 from pathlib import Path
 
 from ..text_tools import str_width
@@ -21,49 +23,128 @@ FILE_PREFIX = "  📄 "
 FOLDER_PREFIX = "▶ 📁 "
 NESTED_PREFIX = "  "
 OPEN_FOLDER_PREFIX = "▼ 📂 "
+OVERSCAN = 8
+"""Number of nodes above and below the visible port that are added to the view."""
 
 if platform.system() == "Windows":
-    from ctypes import windll
+    from ctypes import c_uint32, c_wchar_p, windll
 
     # https://docs.microsoft.com/en-us/windows/win32/fileio/file-attribute-constants
     FILE_ATTRIBUTE_HIDDEN = 0x2
     FILE_ATTRIBUTE_SYSTEM = 0x4
+    INVALID_FILE_ATTRIBUTES = 0xFFFFFFFF
 
     IS_HIDDEN = FILE_ATTRIBUTE_HIDDEN | FILE_ATTRIBUTE_SYSTEM
 
+    _GetFileAttributesW = windll.kernel32.GetFileAttributesW
+    _GetFileAttributesW.argtypes = [c_wchar_p]
+    _GetFileAttributesW.restype = c_uint32
+
+    @lru_cache(maxsize=4096)
     def _is_hidden(path: Path):
-        attrs = windll.kernel32.GetFileAttributesW(str(path.absolute()))
-        return attrs != -1 and bool(attrs & IS_HIDDEN)
+        attrs = _GetFileAttributesW(str(path))
+        return attrs != INVALID_FILE_ATTRIBUTES and bool(attrs & IS_HIDDEN)
+
+    def _is_hidden_entry(entry: os.DirEntry):
+        # On Windows, `DirEntry.stat()` uses attributes from the directory scan.
+        return bool(entry.stat().st_file_attributes & IS_HIDDEN)
 
 else:
 
     def _is_hidden(path: Path):
-        return path.stem.startswith(".")
+        return path.name.startswith(".")
+
+    def _is_hidden_entry(entry: os.DirEntry):
+        return entry.name.startswith(".")
+
+
+@lru_cache
+def _nested_prefix(level: int) -> str:
+    """Return the label prefix for a node at some level."""
+    return NESTED_PREFIX * level
 
 
 class _FileViewNode(TreeViewNode):
-    def __init__(self, path: Path, **kwargs):
-        super().__init__(is_leaf=path.is_file(), **kwargs)
-        self.path = path
+    def __init__(
+        self, path: Path | None = None, entry: os.DirEntry | None = None, **kwargs
+    ):
+        # Directory entries cache file type from the directory scan, so prefer them
+        # to `path` which would stat the file again.
+        if entry is None:
+            super().__init__(is_leaf=path.is_file(), **kwargs)
+            self._is_dir = path.is_dir()
+            self._is_hidden = _is_hidden(path)
+        else:
+            super().__init__(is_leaf=entry.is_file(), **kwargs)
+            self._is_dir = entry.is_dir()
+            self._is_hidden = _is_hidden_entry(entry)
+        self._path = path
+        self._entry = entry
+        self._label_key = None
+        self._label = ""
+        self._label_width = 0
+        self._painted_label = None
 
     @property
-    def label(self) -> str:
-        if self.path.is_file():
+    def path(self) -> Path:
+        # Paths of scanned nodes are only created when needed.
+        if self._path is None:
+            self._path = Path(self._entry.path)
+        return self._path
+
+    @path.setter
+    def path(self, path: Path):
+        self._path = path
+        self._entry = None
+        self._label_key = None
+
+    @property
+    def name(self) -> str:
+        if self._entry is None:
+            return self._path.name
+        return self._entry.name
+
+    def _update_label(self):
+        # Label only depends on whether node is open and its level.
+        key = self.is_open, self.level
+        if key == self._label_key:
+            return
+
+        if self.is_leaf:
             prefix = FILE_PREFIX
         elif self.is_open:
             prefix = OPEN_FOLDER_PREFIX
         else:
             prefix = FOLDER_PREFIX
-        return f"{NESTED_PREFIX * self.level}{prefix}{self.path.name}"
+        nested = _nested_prefix(self.level)
+        name = self.name
+        self._label_key = key
+        self._label = f"{nested}{prefix}{name}"
+        self._label_width = (
+            len(nested)
+            + str_width(prefix)
+            + (len(name) if name.isascii() else str_width(name))
+        )
+
+    @property
+    def label(self) -> str:
+        self._update_label()
+        return self._label
+
+    @property
+    def label_width(self) -> int:
+        self._update_label()
+        return self._label_width
 
     def _toggle_update(self):
         if not self.child_nodes:
-            paths = sorted(
-                self.path.iterdir(), key=lambda path: (path.is_file(), path.name)
-            )
+            with os.scandir(self.path if self._entry is None else self._entry) as it:
+                # Names in a directory are unique, so entries are never compared.
+                entries = [(entry.is_file(), entry.name, entry) for entry in it]
+            entries.sort()
 
-            for path in paths:
-                self.add_node(_FileViewNode(path=path))
+            for _, _, entry in entries:
+                self.add_node(_FileViewNode(entry=entry))
 
     def on_mouse(self, mouse_event):
         if (
@@ -90,77 +171,112 @@ class _FileView(TreeView):
         self.directories_only = directories_only
         self.show_hidden = show_hidden
         self.select_callback = select_callback
+        self._nodes: list[_FileViewNode] = []
+        self._layout: list[tuple[_FileViewNode, bool]] = []
+        self._node_width = 0
         super().__init__(root_node=root_node, **kwargs)
+        self.bind("pos", self._update_window)
 
     def on_add(self):
         self.update_tree_layout()
 
     def update_tree_layout(self):
-        if self.root is None:
+        sv: ScrollView | None = self.parent
+        if (
+            self.root is None
+            or sv is None
+            or sv.parent is None
+            or sv.parent.size == Size(0, 0)
+        ):
             return
 
-        self.prolicide()
-
         alpha = self.root_node.alpha
         is_transparent = self.root_node.is_transparent
         it = self.root_node.iter_open_nodes()
         if self.directories_only:
-            it = (node for node in it if node.path.is_dir())
+            it = (node for node in it if node._is_dir)
         if not self.show_hidden:
-            it = (node for node in it if not _is_hidden(node.path))
+            it = (node for node in it if not node._is_hidden)
 
-        sv: ScrollView = self.parent
         sv.size = sv.parent.size
-        max_width = sv.port_width
-        for y, node in enumerate(it):
-            node.alpha = alpha
-            node.is_transparent = is_transparent
-            node.y = y
-            max_width = max(max_width, str_width(node.label))
-            self.add_gadget(node)
-        self.size = y + 1, max_width
+        nodes = list(it)
+        max_width = max((node.label_width for node in nodes), default=0)
+        max_width = max(max_width, sv.port_width)
+
+        layout = [(node, node.is_open) for node in nodes]
+        if layout != self._layout:
+            self._layout = layout
+            self._nodes = nodes
+            for y, node in enumerate(nodes):
+                node.alpha = alpha
+                node.is_transparent = is_transparent
+                node.y = y
+        self._node_width = max_width
+        self.size = len(nodes), max_width
+        self._update_window()
+
+    def _update_window(self):
+        # Only nodes in or near the scroll view's port are added as children.
+        sv: ScrollView | None = self.parent
+        if sv is None:
+            return
 
-        for node in self.children:
-            node.size = 1, max_width
-            node.add_str(node.label)
+        start = max(0, -self.top - OVERSCAN)
+        stop = -self.top + sv.port_height + OVERSCAN
+        window = self._nodes[start:stop]
+        in_window = set(window)
+        for child in self.children.copy():
+            if child not in in_window:
+                self.remove_gadget(child)
+
+        added = set(self.children)
+        width = self._node_width
+        for node in window:
+            label = node.label
+            if node.width != width or node._painted_label != label:
+                node.size = 1, width
+                node.add_str(label)
+                node._painted_label = label
+            if node not in added:
+                self.add_gadget(node)
+
+    def _selected_index(self) -> int | None:
+        # A laid out node's row is its index in `_nodes`.
+        node = self.selected_node
+        if node is None:
+            return None
+
+        index = node.y
+        if 0 <= index < len(self._nodes) and self._nodes[index] is node:
+            return index
+        return None
 
     def on_key(self, key_event):
-        if not self.children:
+        if not self._nodes:
             return False
 
         if key_event.key == "up":
-            if self.selected_node is None:
-                self.children[0].select()
+            index = self._selected_index()
+            if index is None:
+                self._nodes[0].select()
             else:
-                try:
-                    index = self.children.index(self.selected_node)
-                    if index == 0:
-                        index += 1
-                except ValueError:
-                    index = 1
-
-                self.children[index - 1].select()
+                self._nodes[max(index - 1, 0)].select()
         elif key_event.key == "down":
-            if self.selected_node is None:
-                self.children[0].select()
+            index = self._selected_index()
+            if index is None:
+                self._nodes[0].select()
             else:
-                try:
-                    index = self.children.index(self.selected_node)
-                    if index == len(self.children) - 1:
-                        index -= 1
-                except ValueError:
-                    index = -1
-                self.children[index + 1].select()
+                self._nodes[min(index + 1, len(self._nodes) - 1)].select()
         elif key_event.key == "left":
             if self.selected_node is None:
-                self.children[0].select()
+                self._nodes[0].select()
             elif self.selected_node.is_open:
                 self.selected_node.toggle()
             elif self.selected_node.parent_node is not self.root_node:
                 self.selected_node.parent_node.select()
         elif key_event.key == "right":
             if self.selected_node is None:
-                self.children[0].select()
+                self._nodes[0].select()
             elif self.selected_node.is_leaf:
                 pass
             elif not self.selected_node.is_open:
@@ -401,9 +401,12 @@ class Gadget:
 
             self.on_size()
 
+            # Children's hints only depend on this gadget's size, so they are only
+            # re-applied if it changed.
+            for child in self.children:
+                child.apply_hints()
+
         self._apply_pos_hints()
-        for child in self.children:
-            child.apply_hints()
 
     @property
     def height(self) -> int:
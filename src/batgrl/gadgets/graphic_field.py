@@ -10,7 +10,6 @@ import numpy as np
 from numpy.lib.recfunctions import structured_to_unstructured
 from numpy.typing import NDArray
 
-from ..texture_tools import _composite
 from .gadget import (
     Cell,
     Gadget,
@@ -216,6 +215,7 @@ class GraphicParticleField(Gadget):
             self.particle_properties = particle_properties
 
         self.alpha = alpha
+        self._pos_scratch = None
 
     @property
     def alpha(self) -> float:
@@ -240,41 +240,74 @@ class GraphicParticleField(Gadget):
         offy, offx = self.absolute_pos
         ppos = self.particle_positions
         pcolors = self.particle_colors
+        # Blending fully opaque particles just copies their colors.
+        blend = self.is_transparent and (
+            self.alpha < 1.0 or pcolors[:, 3].min(initial=255) < 255
+        )
+        alpha = round(self.alpha * 255)
+
+        # Reuse a buffer for local particle positions between renders.
+        scratch = self._pos_scratch
+        if (
+            scratch is None
+            or scratch.shape[1] != len(ppos)
+            or scratch.dtype != ppos.dtype
+        ):
+            self._pos_scratch = scratch = np.empty((2, len(ppos)), ppos.dtype)
+
         for rect in self._region.rects():
             height = rect.bottom - rect.top
             width = rect.right - rect.left
-            pos = ppos - (rect.top - offy, rect.left - offx)
-            where_inbounds = np.nonzero(
-                (((0, 0) <= pos) & (pos < (2 * height, width))).all(axis=1)
-            )
-            ys, xs = pos[where_inbounds].T
+            ys = np.subtract(ppos[:, 0], 2 * (rect.top - offy), out=scratch[0])
+            xs = np.subtract(ppos[:, 1], rect.left - offx, out=scratch[1])
+            if (
+                len(ppos)
+                and ys.min() >= 0
+                and ys.max() < 2 * height
+                and xs.min() >= 0
+                and xs.max() < width
+            ):
+                # Every particle is in the rect, so no mask is needed.
+                painted = pcolors
+            else:
+                inbounds = (ys >= 0) & (ys < 2 * height) & (xs >= 0) & (xs < width)
+                ys = ys.compress(inbounds)
+                xs = xs.compress(inbounds)
+                painted = pcolors.compress(inbounds, axis=0)
 
             dst = rect.to_slices()
             color_rect = colors[dst]
 
             if self.is_transparent:
-                mask = chars[dst] != "▀"
-                color_rect[..., :3][mask] = color_rect[..., 3:][mask]
+                # Cells not already half-blocks show their background in both halves.
+                np.copyto(
+                    color_rect[..., :3],
+                    color_rect[..., 3:],
+                    where=(chars[dst] != "▀")[..., None],
+                )
 
-            texture = (
-                color_rect.reshape(height, width, 2, 3)
-                .swapaxes(1, 2)
-                .reshape(2 * height, width, 3)
-            )  # Note this isn't a view.
-            painted = pcolors[where_inbounds]
+            # Each cell holds two vertically stacked pixels: the top pixel in the
+            # foreground and the bottom pixel in the background. Index pixels
+            # directly through a view instead of copying to and from a texture.
+            pixels = color_rect.reshape(height, width, 2, 3)
+            cell_ys = ys >> 1
+            halves = ys & 1
 
-            if self.is_transparent:
-                background = texture[ys, xs]
-                _composite(background, painted[:, :3], painted[:, 3, None], self.alpha)
-                texture[ys, xs] = background
+            if blend:
+                # With weights in [0, 255], `dst * (255 - w) + src * w` fits in 16
+                # bits, so the blend is done in uint16 rather than float64.
+                weights = painted[:, 3, None].astype(np.uint16)
+                if alpha != 255:
+                    weights *= alpha
+                    weights //= 255
+                blended = pixels[cell_ys, xs, halves].astype(np.uint16)
+                blended *= 255 - weights
+                blended += painted[:, :3] * weights
+                blended //= 255
+                pixels[cell_ys, xs, halves] = blended
             else:
-                texture[ys, xs] = painted[..., :3]
+                pixels[cell_ys, xs, halves] = painted[..., :3]
 
-            color_rect[:] = (
-                texture.reshape(height, 2, width, 3)
-                .swapaxes(1, 2)
-                .reshape(height, width, 6)
-            )
             chars[dst] = "▀"
             styles[dst] = False
 
@@ -213,7 +213,8 @@ class Graphics(Gadget):
     def on_size(self):
         """Resize texture array."""
         h, w = self.size
-        self.texture = resize_texture(self.texture, (2 * h, w), self.interpolation)
+        if self.texture.shape[:2] != (2 * h, w):
+            self.texture = resize_texture(self.texture, (2 * h, w), self.interpolation)
 
     @property
     def interpolation(self) -> Interpolation:
@@ -244,8 +245,8 @@ class Graphics(Gadget):
             odd_rows = texture[2 * src_y.start + 1 : 2 * src_y.stop : 2, src_x]
 
             if self.is_transparent:
-                mask = chars[dst] != "▀"
-                fg_rect[mask] = bg_rect[mask]
+                # Cells not already half-blocks show their background in both halves.
+                np.copyto(fg_rect, bg_rect, where=(chars[dst] != "▀")[..., None])
                 _composite(fg_rect, even_rows[..., :3], even_rows[..., 3, None], alpha)
                 _composite(bg_rect, odd_rows[..., :3], odd_rows[..., 3, None], alpha)
             else:
@@ -1,5 +1,6 @@
 """An image gadget."""
 
+from functools import lru_cache
 from pathlib import Path
 from typing import Self
 
@@ -20,6 +21,19 @@ from .graphics import (
 __all__ = ["Image", "Interpolation", "Point", "Size"]
 
 
+@lru_cache(maxsize=64)
+def _read_texture(path: Path, mtime_ns: int) -> NDArray[np.uint8]:
+    """
+    Return a read-only texture from a path to an image.
+
+    Textures are cached by path and modification time so images that share a file
+    only decode it once.
+    """
+    texture = read_texture(path)
+    texture.flags.writeable = False
+    return texture
+
+
 class Image(Graphics):
     r"""
     An Image gadget.
@@ -213,7 +227,8 @@ class Image(Graphics):
         if path is None:
             self._otexture = np.full((1, 1, 4), self.default_color, dtype=np.uint8)
         else:
-            self._otexture = read_texture(path)
+            path = Path(path).absolute()
+            self._otexture = _read_texture(path, path.stat().st_mtime_ns)
         self.on_size()
 
     def on_size(self):
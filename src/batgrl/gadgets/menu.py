@@ -3,7 +3,8 @@
 from __future__ import annotations
 
 from collections.abc import Callable, Iterable, Iterator
-from inspect import signature
+from inspect import CO_VARARGS, CO_VARKEYWORDS, signature
+from types import FunctionType, MethodType
 from typing import Self
 
 from batgrl.terminal.events import KeyEvent
@@ -32,16 +33,46 @@ CHECK_ON = "▣"
 
 def nargs(callable: Callable) -> int:
     """Return the number of arguments of `callable`."""
-    return len(signature(callable).parameters)
+    # Plain functions and methods are counted from their code objects, which is much
+    # cheaper than building a signature. Everything else, including wrapped
+    # functions whose signature is their wrappee's, falls back to `signature`.
+    func = callable.__func__ if isinstance(callable, MethodType) else callable
+    if (
+        type(func) is not FunctionType
+        or hasattr(func, "__wrapped__")
+        or hasattr(func, "__signature__")
+    ):
+        return len(signature(callable).parameters)
+
+    code = func.__code__
+    n = (
+        code.co_argcount
+        + code.co_kwonlyargcount
+        + bool(code.co_flags & CO_VARARGS)
+        + bool(code.co_flags & CO_VARKEYWORDS)
+    )
+    return n - (func is not callable)
+
+
+def _noop() -> None:
+    """Default item callback."""
 
 
 class _MenuItem(Themable, ToggleButtonBehavior, Pane):
+    _STATE_COLORS = {
+        "disallowed": "menu_item_disallowed",
+        "normal": "primary",
+        "hover": "menu_item_hover",
+        "down": "menu_item_hover",
+    }
+    """Color theme attribute for each button state."""
+
     def __init__(
         self,
         *,
         left_label: str = "",
         right_label: str = "",
-        item_callback: ItemCallback = lambda: None,
+        item_callback: ItemCallback = _noop,
         submenu: Menu | None = None,
         **kwargs,
     ):
@@ -54,23 +85,58 @@ class _MenuItem(Themable, ToggleButtonBehavior, Pane):
         )
         self.item_callback = item_callback
         self.submenu = submenu
+        self._menu_index = 0
+        self._painted_color_pair = None
+        self._last_mouse_pos = Point(0, 0)
         super().__init__(**kwargs)
 
+        if self._item_callback_nargs == 1:
+            # Toggle items start off; include the check in the label instead of
+            # painting it afterwards.
+            left_label = f"{left_label[:1]}{CHECK_OFF}{left_label[2:]}"
         self.left_label.add_str(left_label)
         self.right_label.add_str(right_label)
         self.add_gadgets(self.left_label, self.right_label)
-        self.update_off()
+
+    @property
+    def item_callback(self) -> ItemCallback | None:
+        return self._item_callback
+
+    @item_callback.setter
+    def item_callback(self, item_callback: ItemCallback | None):
+        self._item_callback = item_callback
+        # Number of arguments of the callback, or `None` if there is no callback.
+        if item_callback is None:
+            self._item_callback_nargs = None
+        elif item_callback is _noop:
+            self._item_callback_nargs = 0
+        else:
+            self._item_callback_nargs = nargs(item_callback)
+
+    def _index(self) -> int:
+        """Return index of item in parent menu."""
+        # The last known index is checked before falling back to a search in case
+        # the parent's children were reordered.
+        children = self.parent.children
+        i = self._menu_index
+        if i >= len(children) or children[i] is not self:
+            i = self._menu_index = children.index(self)
+        return i
 
     def _repaint(self):
-        if self.button_state == "disallowed":
-            color_pair = self.color_theme.menu_item_disallowed
-        elif self.button_state == "normal":
-            color_pair = self.color_theme.primary
-        elif self.button_state == "hover" or self.button_state == "down":
-            color_pair = self.color_theme.menu_item_hover
-        self.bg_color = color_pair.bg
-        self.left_label.canvas[["fg_color", "bg_color"]] = color_pair
-        self.right_label.canvas[["fg_color", "bg_color"]] = color_pair
+        color_pair = getattr(self.color_theme, self._STATE_COLORS[self.button_state])
+
+        # Items are often set to a state with the same colors, e.g., when a menu closes.
+        if color_pair == self._painted_color_pair:
+            return
+
+        self._painted_color_pair = color_pair
+        fg, bg = color_pair
+        self.bg_color = bg
+        # Single-field writes are cheaper than a multi-field structured assignment.
+        for canvas in (self.left_label.canvas, self.right_label.canvas):
+            canvas["fg_color"] = fg
+            canvas["bg_color"] = bg
 
     @property
     def alpha(self) -> float:
@@ -96,21 +162,23 @@ class _MenuItem(Themable, ToggleButtonBehavior, Pane):
 
     def update_theme(self):
         """Paint the gadget with current theme."""
+        self._painted_color_pair = None
         self._repaint()
 
     def update_hover(self):
         """Update parent menu and submenu on hover state."""
         self._repaint()
 
-        index = self.parent.children.index(self)
+        index = self._index()
         selected = self.parent._current_selection
-        if not (selected == -1 or selected == index):
-            self.parent.close_submenus()
+        if selected != index:
             if selected != -1:
-                last_hovered = self.parent.children[selected]
-                last_hovered.button_state = "normal"
+                self.parent.close_submenus()
+                self.parent.children[selected].button_state = "normal"
+            self.parent._current_selection = index
 
-        self.parent._current_selection = index
+        # Submenu is re-opened even if item was already selected, as it may have been
+        # closed with the keyboard.
         if self.submenu is not None:
             self.submenu.open_menu()
 
@@ -121,7 +189,8 @@ class _MenuItem(Themable, ToggleButtonBehavior, Pane):
             return
 
         if self.submenu is None or not self.submenu.is_enabled:
-            if self.parent._current_selection == self.parent.children.index(self):
+            selected = self.parent._current_selection
+            if selected != -1 and self.parent.children[selected] is self:
                 self.parent._current_selection = -1
         elif not self.submenu.collides_point(self._last_mouse_pos):
             self.submenu.close_menu()
@@ -133,12 +202,12 @@ class _MenuItem(Themable, ToggleButtonBehavior, Pane):
 
     def update_off(self):
         """Paint the off state."""
-        if self.item_callback is not None and nargs(self.item_callback) == 1:
+        if self._item_callback_nargs == 1:
             self.left_label.canvas["char"][0, 1] = CHECK_OFF
 
     def update_on(self):
         """Paint the on state."""
-        if self.item_callback is not None and nargs(self.item_callback) == 1:
+        if self._item_callback_nargs == 1:
             self.left_label.canvas["char"][0, 1] = CHECK_ON
 
     def on_mouse(self, mouse_event):
@@ -150,7 +219,7 @@ class _MenuItem(Themable, ToggleButtonBehavior, Pane):
         """Open submenu or call item callback on release."""
         if self.submenu is not None:
             self.submenu.open_menu()
-        elif nargs(self.item_callback) == 0:
+        elif self._item_callback_nargs == 0:
             self.item_callback()
 
             if self.parent.close_on_release:
@@ -160,7 +229,7 @@ class _MenuItem(Themable, ToggleButtonBehavior, Pane):
 
     def on_toggle(self):
         """Call item callback on toggle state change."""
-        if self.item_callback is not None and nargs(self.item_callback) == 1:
+        if self._item_callback_nargs == 1:
             self.item_callback(self.toggle_state)
 
 
@@ -403,6 +472,7 @@ class Menu(GridLayout):
         self._parent_menu = None
         self._current_selection = -1
         self._submenus = []
+        self._last_hit_submenu = None
         self._menu_button = None
 
     @property
@@ -443,8 +513,10 @@ class Menu(GridLayout):
             self._current_selection = -1
             self.close_submenus()
 
+            # Usually only the selected item isn't already normal.
             for child in self.children:
-                child.button_state = "normal"
+                if child.button_state != "normal":
+                    child.button_state = "normal"
 
     def close_submenus(self):
         """Close all submenus."""
@@ -458,6 +530,20 @@ class Menu(GridLayout):
         else:
             self.close_menu()
 
+    def _submenus_collide(self, point: Point) -> bool:
+        """Return true if point collides with a submenu."""
+        # Consecutive clicks are usually in the same submenu, so it is tested first.
+        last_hit = self._last_hit_submenu
+        if last_hit is not None and last_hit.collides_point(point):
+            return True
+
+        for submenu in self._submenus:
+            if submenu is not last_hit and submenu.collides_point(point):
+                self._last_hit_submenu = submenu
+                return True
+
+        return False
+
     def on_mouse(self, mouse_event):
         """Close menus on non-colliding mouse down."""
         if (
@@ -465,10 +551,7 @@ class Menu(GridLayout):
             and self.close_on_click
             and not (
                 self.collides_point(mouse_event.pos)
-                or any(
-                    submenu.collides_point(mouse_event.pos)
-                    for submenu in self._submenus
-                )
+                or self._submenus_collide(mouse_event.pos)
             )
         ):
             self.close_menu()
@@ -485,21 +568,23 @@ class Menu(GridLayout):
                 else:
                     break
 
+        children = self.children
+        nchildren = len(children)
+
         if key_event.key == "up":
             i = self._current_selection
             if i == -1:
-                i = len(self.children) - 1
+                i = nchildren - 1
             else:
-                i = self._current_selection
-                self.children[i].button_state = "normal"
-                i = (i - 1) % len(self.children)
+                children[i].button_state = "normal"
+                i = (i - 1) % nchildren
 
-            for _ in self.children:
-                if self.children[i].item_disabled:
-                    i = (i - 1) % len(self.children)
+            for _ in range(nchildren):
+                if children[i].button_state == "disallowed":
+                    i = (i - 1) % nchildren
                 else:
                     self._current_selection = i
-                    self.children[i]._hover()
+                    children[i].button_state = "hover"
                     self.close_submenus()
                     return True
 
@@ -510,15 +595,15 @@ class Menu(GridLayout):
             if i == -1:
                 i = 0
             else:
-                self.children[i].button_state = "normal"
-                i = (i + 1) % len(self.children)
+                children[i].button_state = "normal"
+                i = (i + 1) % nchildren
 
-            for _ in self.children:
-                if self.children[i].item_disabled:
-                    i = (i + 1) % len(self.children)
+            for _ in range(nchildren):
+                if children[i].button_state == "disallowed":
+                    i = (i + 1) % nchildren
                 else:
                     self._current_selection = i
-                    self.children[i]._hover()
+                    children[i].button_state = "hover"
                     self.close_submenus()
                     return True
 
@@ -526,7 +611,7 @@ class Menu(GridLayout):
 
         if key_event.key == "left":
             if self._current_selection != -1 and (
-                (submenu := self.children[self._current_selection].submenu)
+                (submenu := children[self._current_selection].submenu)
                 and submenu.is_enabled
             ):
                 submenu.close_menu()
@@ -534,24 +619,22 @@ class Menu(GridLayout):
 
         if key_event.key == "right":
             if self._current_selection != -1 and (
-                (submenu := self.children[self._current_selection].submenu)
+                (submenu := children[self._current_selection].submenu)
                 and not submenu.is_enabled
             ):
                 submenu.open_menu()
                 if submenu.children:
-                    submenu.children[0]._hover()
+                    submenu.children[0].button_state = "hover"
                     submenu.close_submenus()
                 return True
 
         if key_event.key == "enter":
             if (
                 self._current_selection != -1
-                and (child := self.children[self._current_selection]).submenu is None
+                and (child := children[self._current_selection]).submenu is None
             ):
-                if (n := nargs(child.item_callback)) == 0:
-                    child.on_release()
-                elif n == 1:
-                    child._down()
+                # Releasing an item calls its callback or toggles it.
+                child.on_release()
                 return True
 
         return super().on_key(key_event)
@@ -641,6 +724,7 @@ class Menu(GridLayout):
             else:
                 raise TypeError(f"expected Callable or dict, got {type(value)}")
 
+            menu_item._menu_index = i
             menu_gadget.add_gadget(menu_item)
 
         yield menu_gadget
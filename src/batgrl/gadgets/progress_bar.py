@@ -1,7 +1,8 @@
 """A progress bar gadget."""
 
 import asyncio
-from itertools import chain, cycle
+
+import numpy as np
 
 from ..text_tools import smooth_horizontal_bar, smooth_vertical_bar
 from .behaviors.themable import Themable
@@ -19,6 +20,19 @@ from .text import Text
 __all__ = ["ProgressBar", "Point", "Size"]
 
 
+def _smooth_bar_key(offset: float) -> int:
+    """
+    Return a key for the full-length smooth bar at `offset` used by the loading
+    animation.
+
+    A full-length smooth bar only depends on which of the 8 eighth-blocks the offset
+    rounds to, and whether the offset is 0.
+    """
+    if offset == 0:
+        return -1
+    return round(offset * 8)
+
+
 class ProgressBar(Themable, Gadget):
     r"""
     A progress bar gadget.
@@ -172,6 +186,10 @@ class ProgressBar(Themable, Gadget):
         is_enabled: bool = True,
     ):
         self._bar = Text()
+        self._bar_span = None
+        self._smooth_bars: dict[int, tuple[str, ...]] = {}
+        self._bar_length: int | None = None
+        self._loading_handle: asyncio.TimerHandle | None = None
         super().__init__(
             size=size,
             pos=pos,
@@ -207,11 +225,9 @@ class ProgressBar(Themable, Gadget):
 
         self._bar.size = self.size
 
-        if getattr(self, "_loading_task", False):
-            self._loading_task.cancel()
-
+        self._stop_loading_animation()
         if self._progress is None:
-            self._loading_task = asyncio.create_task(self._loading_animation())
+            self._start_loading_animation()
         else:
             self._paint_progress_bar()
 
@@ -223,37 +239,65 @@ class ProgressBar(Themable, Gadget):
     @is_horizontal.setter
     def is_horizontal(self, is_horizontal: bool):
         self._is_horizontal = is_horizontal
+        self._bar_length = None
         self._update_bar()
 
     def _paint_small_horizontal_bar(self, progress):
         bar_width = max(1, (self.width - 1) // 2)
         x, offset = divmod(progress * (self.width - bar_width), 1)
         x = int(x)
-        smooth_bar = smooth_horizontal_bar(bar_width, 1, offset)
+        key = _smooth_bar_key(offset)
+        if (smooth_bar := self._smooth_bars.get(key)) is None:
+            smooth_bar = smooth_horizontal_bar(bar_width, 1, offset)
+            self._smooth_bars[key] = smooth_bar
 
+        self._clear_bar_span()
+        self._bar_span = np.s_[:, x : x + len(smooth_bar)]
         canvas = self._bar.canvas
-        canvas["char"] = " "
-        canvas["char"][:, x : x + len(smooth_bar)] = smooth_bar
-        canvas[["fg_color", "bg_color"]] = self.color_theme.progress_bar
+        canvas["char"][self._bar_span] = smooth_bar
         if offset != 0:
-            canvas["fg_color"][:, x] = self.color_theme.progress_bar.bg
-            canvas["bg_color"][:, x] = self.color_theme.progress_bar.fg
+            fg, bg = self.color_theme.progress_bar
+            canvas["fg_color"][:, x] = bg
+            canvas["bg_color"][:, x] = fg
 
     def _paint_small_vertical_bar(self, progress):
         bar_height = max(1, (self.height - 1) // 2)
         y, offset = divmod(progress * (self.height - bar_height), 1)
         y = int(y)
-        smooth_bar = smooth_vertical_bar(bar_height, 1, offset)
-
+        key = _smooth_bar_key(offset)
+        if (smooth_bar := self._smooth_bars.get(key)) is None:
+            smooth_bar = smooth_vertical_bar(bar_height, 1, offset)
+            self._smooth_bars[key] = smooth_bar
+
+        self._clear_bar_span()
+        bottom = self.height - y
+        self._bar_span = np.s_[max(0, bottom - len(smooth_bar)) : bottom]
         canvas = self._bar.canvas
-        canvas["char"] = " "
         canvas["char"][::-1][y : y + len(smooth_bar)].T[:] = smooth_bar
-        canvas[["fg_color", "bg_color"]] = self.color_theme.progress_bar
         if offset != 0:
-            canvas["fg_color"][::-1][y] = self.color_theme.progress_bar.bg
-            canvas["bg_color"][::-1][y] = self.color_theme.progress_bar.fg
+            fg, bg = self.color_theme.progress_bar
+            canvas["fg_color"][::-1][y] = bg
+            canvas["bg_color"][::-1][y] = fg
 
-    async def _loading_animation(self):
+    def _clear_bar(self):
+        """Fill bar canvas with blank cells in progress bar colors."""
+        canvas = self._bar.canvas
+        fg, bg = self.color_theme.progress_bar
+        canvas["char"].fill(" ")
+        canvas["fg_color"][:] = fg
+        canvas["bg_color"][:] = bg
+
+    def _clear_bar_span(self):
+        """Erase the bar painted by the last frame of the loading animation."""
+        if self._bar_span is not None:
+            canvas = self._bar.canvas
+            canvas["char"][self._bar_span] = " "
+            canvas[["fg_color", "bg_color"]][self._bar_span] = (
+                self.color_theme.progress_bar
+            )
+
+    def _start_loading_animation(self):
+        self._bar_length = None
         if (
             self.is_horizontal
             and self.width < 3
@@ -262,18 +306,45 @@ class ProgressBar(Themable, Gadget):
         ):
             return
 
-        self._bar.canvas["char"] = " "
+        self._clear_bar()
+        self._bar_span = None
+        self._smooth_bars = {}
 
         if self._is_horizontal:
-            steps = 8 * self.width
-            paint = self._paint_small_horizontal_bar
+            self._loading_steps = 8 * self.width
+            self._paint_loading_bar = self._paint_small_horizontal_bar
         else:
-            steps = 8 * self.height
-            paint = self._paint_small_vertical_bar
-
-        for i in cycle(chain(range(steps + 1), range(steps)[::-1])):
-            paint(i / steps)
-            await asyncio.sleep(self.animation_delay)
+            self._loading_steps = 8 * self.height
+            self._paint_loading_bar = self._paint_small_vertical_bar
+
+        self._loading_step = 0
+        self._loading_time = asyncio.get_running_loop().time()
+        self._loading_tick()
+
+    def _loading_tick(self):
+        """Paint a frame of the loading animation and schedule the next frame."""
+        # The bar moves forward `steps` steps and then back `steps` steps, pausing
+        # a frame at the start.
+        steps = self._loading_steps
+        i = self._loading_step % (2 * steps + 1)
+        self._paint_loading_bar((i if i <= steps else 2 * steps - i) / steps)
+
+        loop = asyncio.get_running_loop()
+        delay = self.animation_delay
+        self._loading_time += delay
+        self._loading_step += 1
+        if delay > 0:
+            # Drop frames if the event loop has fallen behind.
+            dropped = int((loop.time() - self._loading_time) // delay)
+            if dropped > 0:
+                self._loading_step += dropped
+                self._loading_time += dropped * delay
+        self._loading_handle = loop.call_at(self._loading_time, self._loading_tick)
+
+    def _stop_loading_animation(self):
+        if self._loading_handle is not None:
+            self._loading_handle.cancel()
+            self._loading_handle = None
 
     def on_add(self):
         """Start loading animation on add if progress is None."""
@@ -283,11 +354,11 @@ class ProgressBar(Themable, Gadget):
     def on_remove(self):
         """Cancel loading animation on remove."""
         super().on_remove()
-        if task := getattr(self, "_loading_task", False):
-            task.cancel()
+        self._stop_loading_animation()
 
     def on_size(self):
         """Repaint bar on resize."""
+        self._bar_length = None
         self._update_bar()
 
     def update_theme(self):
@@ -298,11 +369,22 @@ class ProgressBar(Themable, Gadget):
 
     def _paint_progress_bar(self):
         canvas = self._bar.canvas
-        canvas["char"] = " "
-        canvas[["fg_color", "bg_color"]] = self.color_theme.progress_bar
         if self.is_horizontal:
             smooth_bar = smooth_horizontal_bar(self.width, self.progress)
-            canvas["char"][:, : len(smooth_bar)] = smooth_bar
+            chars = canvas["char"]
         else:
             smooth_bar = smooth_vertical_bar(self.height, self.progress)
-            canvas["char"][::-1][: len(smooth_bar)].T[:] = smooth_bar
+            chars = canvas["char"][::-1].T
+
+        # Only the cells from the last partial block of the previous bar to the end
+        # of the longer of the two bars can differ.
+        bar_length = len(smooth_bar)
+        if self._bar_length is None:
+            self._clear_bar()
+            start = 0
+        else:
+            start = max(0, min(self._bar_length, bar_length) - 1)
+            chars[:, bar_length : self._bar_length] = " "
+
+        chars[:, start:bar_length] = smooth_bar[start:]
+        self._bar_length = bar_length
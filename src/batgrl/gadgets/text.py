@@ -310,8 +310,11 @@ class Text(Gadget):
         copy_h = min(old_h, h)
         copy_w = min(old_w, w)
 
-        self.canvas = np.full((h, w), self.default_cell)
-        self.canvas[:copy_h, :copy_w] = old_canvas[:copy_h, :copy_w]
+        # Only cells outside the preserved region need the default cell.
+        self.canvas = canvas = np.empty((h, w), old_canvas.dtype)
+        canvas[:copy_h, :copy_w] = old_canvas[:copy_h, :copy_w]
+        canvas[:copy_h, copy_w:] = self.default_cell
+        canvas[copy_h:] = self.default_cell
 
     def add_border(
         self,
@@ -1,9 +1,12 @@
 """A text-pad gadget for multiline editable text."""
 
-from dataclasses import astuple
+from collections import deque
+
+import numpy as np
+from numpy.typing import NDArray
 
 from ..terminal.events import KeyEvent, MouseEvent, PasteEvent
-from ..text_tools import is_word_char, str_width
+from ..text_tools import cell_sans, is_word_char, str_width
 from ._cursor import Cursor
 from .behaviors.focusable import Focusable
 from .behaviors.grabbable import Grabbable
@@ -20,6 +23,42 @@ from .text import Text
 
 __all__ = ["TextPad", "Point", "Size"]
 
+_UNDO_LIMIT = 1024
+"""Maximum number of edits kept on the undo and redo stacks."""
+
+_ASCII_WORD_CHARS = frozenset(filter(is_word_char, map(chr, range(128))))
+"""Ascii word characters."""
+
+_ASCII_WORD_CHAR_TABLE = np.array([chr(i) in _ASCII_WORD_CHARS for i in range(128)])
+"""Lookup table of whether an ascii code point is a word character."""
+
+
+def _word_char_mask(chars: NDArray[np.str_]) -> NDArray[np.bool_]:
+    """
+    Return whether each character in a row of canvas characters is a word character.
+
+    The empty cell following a wide character has the same class as the wide
+    character.
+    """
+    codes = chars.view(np.uint32)
+    is_ascii = codes < 128
+    mask = _ASCII_WORD_CHAR_TABLE[np.where(is_ascii, codes, 0)]
+    for i in np.flatnonzero(~is_ascii):
+        mask[i] = is_word_char(chars[i])
+    empty = np.flatnonzero(codes[1:] == 0) + 1
+    mask[empty] = mask[empty - 1]
+    return mask
+
+
+def _chars_to_str(chars: NDArray[np.str_]) -> str:
+    """Return the text in a row of canvas characters."""
+    if chars.size == 0:
+        return ""
+    # View the row as a single string. The empty cells following wide characters
+    # become nulls which are removed.
+    text = np.ascontiguousarray(chars).view(f"U{chars.size}")[0]
+    return str(text).replace("\0", "")
+
 
 class TextPad(Themable, Grabbable, Focusable, Gadget):
     r"""
@@ -239,10 +278,24 @@ class TextPad(Themable, Grabbable, Focusable, Gadget):
         self._last_x = None
         self._selection_start = self._selection_end = None
         self._line_lengths = [0]
-        self._undo_stack = []
-        self._redo_stack = []
+        self._max_line_length = 0
+        self._end_text_point = Point(0, 0)
+        # Whether a line may only contain ascii characters, in which case its length
+        # in characters is its width.
+        self._line_is_ascii = [True]
+        self._undo_stack = deque(maxlen=_UNDO_LIMIT)
+        self._redo_stack = deque(maxlen=_UNDO_LIMIT)
         self._undo_buffer = []
         self._undo_buffer_type = "add"
+        # Whether cursor moves should skip scrolling and highlighting, e.g., while
+        # replaying a batch of edits.
+        self._suspend_cursor_updates = False
+        # Rows painted by the last highlight or `None` if the whole pad needs
+        # repainting.
+        self._highlighted_rows: slice | None = None
+        # Row of the last line highlight or `None` if it needs repainting.
+        self._line_highlight_y: int | None = None
+        self._default_colors = self._pad.default_fg_color, self._pad.default_bg_color
         self.alpha = alpha
 
         self._pad.add_gadget(self._cursor)
@@ -278,6 +331,7 @@ class TextPad(Themable, Grabbable, Focusable, Gadget):
         self._cursor.fg_color = bg
         self._pad.canvas["fg_color"] = self._pad.default_fg_color = fg
         self._pad.canvas["bg_color"] = self._pad.default_bg_color = bg
+        self._default_colors = fg, bg
         self._highlight_selection()
 
     def on_add(self):
@@ -286,7 +340,7 @@ class TextPad(Themable, Grabbable, Focusable, Gadget):
 
         def resize_pad():
             height = max(len(self._line_lengths), self._scroll_view.port_height)
-            width = max(max(self._line_lengths) + 1, self._scroll_view.port_width)
+            width = max(self._max_line_length + 1, self._scroll_view.port_width)
             self._pad.size = height, width
             self._highlight_selection()
 
@@ -311,40 +365,41 @@ class TextPad(Themable, Grabbable, Focusable, Gadget):
         if self._undo_buffer:
             self._undo_stack.append(self._undo_buffer)
             self._undo_buffer = []
-            self._redo_stack.clear()
+            if self._redo_stack:
+                self._redo_stack.clear()
+
+    def _replay(self, edits):
+        """Replay a batch of edits in reverse and return the inverse edits."""
+        inverse = []
+        self._suspend_cursor_updates = True
+        try:
+            for func, args, selection_start, selection_end, cursor in reversed(edits):
+                inverse.append(func(*args))
+                self._selection_start = selection_start
+                self._selection_end = selection_end
+                self.cursor = cursor
+        finally:
+            self._suspend_cursor_updates = False
+        # Scroll to and highlight only the final cursor.
+        self.cursor = self.cursor
+        return inverse
 
     def undo(self):
         """Undo previous edit."""
         self._move_undo_buffer_to_stack()
         if self._undo_stack:
-            redo = []
-            for func, args, selection_start, selection_end, cursor in reversed(
-                self._undo_stack.pop()
-            ):
-                redo.append(func(*args))
-                self._selection_start = selection_start
-                self._selection_end = selection_end
-                self.cursor = cursor
-            self._redo_stack.append(redo)
+            self._redo_stack.append(self._replay(self._undo_stack.pop()))
 
     def redo(self):
         """Redo previous undo."""
         if self._redo_stack and not self._undo_buffer:
-            undo = []
-            for func, args, selection_start, selection_end, cursor in reversed(
-                self._redo_stack.pop()
-            ):
-                undo.append(func(*args))
-                self._selection_start = selection_start
-                self._selection_end = selection_end
-                self.cursor = cursor
-            self._undo_stack.append(undo)
+            self._undo_stack.append(self._replay(self._redo_stack.pop()))
 
     @property
     def text(self) -> str:
         """The text pad's text."""
         return "\n".join(
-            "".join(row[:line_length])
+            _chars_to_str(row[:line_length])
             for row, line_length in zip(self._pad.canvas["char"], self._line_lengths)
         )
 
@@ -367,14 +422,23 @@ class TextPad(Themable, Grabbable, Focusable, Gadget):
     def cursor(self, cursor: Point):
         """After setting cursor position, move pad so that cursor is visible."""
         self._cursor.pos = cursor
-        self._scroll_view.scroll_to_rect(cursor)
         if self.is_selecting:
             self._selection_end = self.cursor
-        self._highlight_selection()
+        if not self._suspend_cursor_updates:
+            self._scroll_view.scroll_to_rect(cursor)
+            # Line highlight is unchanged if cursor stays on the same row.
+            if (
+                self._selection_start != self._selection_end
+                or self._line_highlight_y != self._cursor.y
+            ):
+                self._highlight_selection()
 
     def _highlight_selection(self):
         colors = self._pad.canvas[["fg_color", "bg_color"]]
-        colors[:] = self._pad.default_fg_color, self._pad.default_bg_color
+        if self._highlighted_rows is None:
+            colors[:] = self._default_colors
+        else:
+            colors[self._highlighted_rows] = self._default_colors
 
         if self._selection_start != self._selection_end:
             if self._selection_start > self._selection_end:
@@ -393,8 +457,13 @@ class TextPad(Themable, Grabbable, Focusable, Gadget):
                 colors[ey, :ex] = highlight
                 for i in range(sy + 1, ey):
                     colors[i, : ll[i]] = highlight
+            self._highlighted_rows = slice(sy, ey + 1)
+            self._line_highlight_y = None
         else:  # If no selection or selection is empty, add line highlight.
-            colors[self.cursor.y, :] = self.color_theme.text_pad_line_highlight
+            y = self.cursor.y
+            colors[y, :] = self.color_theme.text_pad_line_highlight
+            self._highlighted_rows = slice(y, y + 1)
+            self._line_highlight_y = y
 
     @property
     def is_selecting(self) -> bool:
@@ -409,8 +478,7 @@ class TextPad(Themable, Grabbable, Focusable, Gadget):
     @property
     def end_text_point(self) -> Point:
         """Point after last character in text."""
-        ll = self._line_lengths
-        return Point(len(ll) - 1, ll[-1])
+        return self._end_text_point
 
     @property
     def page_lines(self) -> int:
@@ -432,6 +500,7 @@ class TextPad(Themable, Grabbable, Focusable, Gadget):
             return self._del_text(self._selection_start, self._selection_end)
 
     def _del_text(self, start: Point, end: Point):
+        self._line_highlight_y = None
         ll = self._line_lengths
 
         pad = self._pad
@@ -449,40 +518,77 @@ class TextPad(Themable, Grabbable, Focusable, Gadget):
         if ex > ll[ey]:
             ex = ll[ey]
 
-        contents = "\n".join(
-            "".join(
-                canvas["char"][y, sx if y == sy else None : ex if y == ey else ll[y]]
-            )
-            for y in range(sy, ey + 1)
-        )
+        # Deleted text is only built from a copy of its rows if the deletion is undone.
+        deleted_chars = canvas["char"][sy : ey + 1].copy()
+        deleted_lengths = ll[sy : ey + 1]
         selection_start = self._selection_start
         selection_end = self._selection_end
         cursor = self.cursor
 
+        # The longest line only needs to be found again if it was deleted.
+        deleted_max = max(ll[sy : ey + 1])
         len_end = ll[ey] - ex
         len_start = ll[sy] = sx + len_end
+        is_ascii = self._line_is_ascii
+        is_ascii[sy] = len_start == 0 or is_ascii[sy] and is_ascii[ey]
 
         canvas[sy, sx:len_start] = canvas[ey, ex : ex + len_end]
         canvas[sy, len_start:] = pad.default_cell
 
-        remaining = canvas[ey + 1 :]
-        canvas[sy + 1 : sy + 1 + len(remaining)] = remaining
-
-        del ll[sy + 1 : ey + 1]
+        if sy != ey:  # Move rows after deletion up.
+            remaining = canvas[ey + 1 :]
+            canvas[sy + 1 : sy + 1 + len(remaining)] = remaining
+            self._highlighted_rows = None
+            del ll[sy + 1 : ey + 1]
+            del is_ascii[sy + 1 : ey + 1]
+
+        if len_start < deleted_max == self._max_line_length:
+            self._max_line_length = max(ll)
+        elif len_start > self._max_line_length:
+            self._max_line_length = len_start
         height = max(len(ll), self._scroll_view.port_height)
-        width = max(max(ll) + 1, self._scroll_view.port_width)
+        width = max(self._max_line_length + 1, self._scroll_view.port_width)
         pad.size = height, width
+        self._end_text_point = Point(len(ll) - 1, ll[-1])
 
         self.unselect()
         self._last_x = None
         self.cursor = start
-        return self._add_text, [start, contents], selection_start, selection_end, cursor
+        return (
+            self._restore_text,
+            [start, deleted_chars, deleted_lengths, sx, ex],
+            selection_start,
+            selection_end,
+            cursor,
+        )
+
+    def _restore_text(
+        self,
+        pos: Point,
+        chars: NDArray[np.str_],
+        line_lengths: list[int],
+        start_x: int,
+        end_x: int,
+    ):
+        """Add back text deleted by `_del_text`."""
+        last = len(line_lengths) - 1
+        text = "\n".join(
+            _chars_to_str(
+                row[start_x if y == 0 else None : end_x if y == last else line_length]
+            )
+            for y, (row, line_length) in enumerate(zip(chars, line_lengths))
+        )
+        return self._add_text(pos, text)
 
     def _add_text(self, pos: Point, text: str):
+        self._line_highlight_y = None
         y, x = pos
         pad = self._pad
         ll = self._line_lengths
-        line_remaining = pad.canvas[y, x : ll[y]].copy()
+        is_ascii = self._line_is_ascii
+        len_remaining = ll[y] - x
+        # Nothing needs to be moved if adding text at end of line.
+        line_remaining = pad.canvas[y, x : ll[y]].copy() if len_remaining else None
 
         selection_start = self._selection_start
         selection_end = self._selection_end
@@ -494,11 +600,21 @@ class TextPad(Themable, Grabbable, Focusable, Gadget):
             width_line = str_width(line)
 
             ll[y] += width_line
+            is_ascii[y] = is_ascii[y] and line.isascii()
+            if ll[y] > self._max_line_length:
+                self._max_line_length = ll[y]
             if ll[y] >= pad.width:
                 pad.width = ll[y] + 1
 
-            pad.add_str(line, pos=(y, x))
-            pad.canvas[y, x + width_line : ll[y]] = line_remaining
+            if len(line) == 1 and line.isascii() and line.isprintable():
+                # A typed character can be written directly to its cell.
+                cell = pad.canvas[y, x : x + 1]
+                cell[cell_sans("char", "fg_color", "bg_color")] = False
+                cell["char"] = line
+            else:
+                pad.add_str(line, pos=(y, x))
+            if line_remaining is not None:
+                pad.canvas[y, x + width_line : ll[y]] = line_remaining
             self.cursor = y, x + width_line
         else:
             first, *lines, last = lines
@@ -506,29 +622,56 @@ class TextPad(Themable, Grabbable, Focusable, Gadget):
             width_last = str_width(last)
             last_y = y + newlines
 
+            split_length = ll[y]
             ll[y] = x + str_width(first)
-            for i, line in enumerate(lines, start=y + 1):
-                ll.insert(i, str_width(line))
-            ll.insert(last_y, width_last + str_width("".join(line_remaining["char"])))
-
+            ll[y + 1 : y + 1] = [
+                *map(str_width, lines),
+                width_last + len_remaining,
+            ]
+            is_ascii[y + 1 : y + 1] = [
+                *(line.isascii() for line in lines),
+                is_ascii[y] and last.isascii(),
+            ]
+            is_ascii[y] = is_ascii[y] and first.isascii()
+
+            added_max = max(ll[y : last_y + 1])
+            if added_max < split_length == self._max_line_length:
+                self._max_line_length = max(ll)
+            elif added_max > self._max_line_length:
+                self._max_line_length = added_max
             height = max(len(ll), self._scroll_view.port_height)
-            max_width = max(ll)
+            max_width = self._max_line_length
             width = pad.width if max_width < pad.width else max_width + 1
             pad.size = height, width
 
             pad.canvas[y + newlines + 1 :] = pad.canvas[y + 1 : -newlines]
+            self._highlighted_rows = None  # Highlighted rows have moved.
             pad.canvas[y, ll[y] :] = pad.default_cell
 
             pad.add_str(first, pos=(y, x))
-            for i, line in enumerate(lines, start=y + 1):
-                pad.add_str(line.ljust(pad.width), pos=(i, 0))
+            middle = "".join(lines)
+            if lines and middle.isascii() and middle.isprintable():
+                # Each character fills exactly one cell, so all lines can be written
+                # at once.
+                rows = pad.canvas[y + 1 : last_y]
+                rows[cell_sans("char", "fg_color", "bg_color")] = False
+                rows["char"] = (
+                    np.array([line.ljust(pad.width) for line in lines])
+                    .view("U1")
+                    .reshape(-1, pad.width)
+                )
+            else:
+                for i, line in enumerate(lines, start=y + 1):
+                    pad.add_str(line.ljust(pad.width), pos=(i, 0))
 
             pad.add_str(last, pos=(last_y, 0))
-            pad.canvas[last_y, width_last : ll[last_y]] = line_remaining
+            if line_remaining is not None:
+                pad.canvas[last_y, width_last : ll[last_y]] = line_remaining
             pad.canvas[last_y, ll[last_y] :] = pad.default_cell
 
             self.cursor = last_y, width_last
 
+        self._end_text_point = Point(len(ll) - 1, ll[-1])
         return (
             self._del_text,
             [cursor, self.cursor],
@@ -543,11 +686,17 @@ class TextPad(Themable, Grabbable, Focusable, Gadget):
         y, x = self._cursor.pos
 
         while n > 0:
-            text_before_cursor = "".join(self._pad.canvas["char"][y, :x])
-            nchars_before_cursor = len(text_before_cursor)
-            if n <= nchars_before_cursor:
-                x = str_width(text_before_cursor[:-n])
-                break
+            if self._line_is_ascii[y]:
+                nchars_before_cursor = x
+                if n <= nchars_before_cursor:
+                    x -= n
+                    break
+            else:
+                text_before_cursor = "".join(self._pad.canvas["char"][y, :x])
+                nchars_before_cursor = len(text_before_cursor)
+                if n <= nchars_before_cursor:
+                    x = str_width(text_before_cursor[:-n])
+                    break
 
             if y == 0:
                 x = 0
@@ -565,15 +714,21 @@ class TextPad(Themable, Grabbable, Focusable, Gadget):
         y, x = self._cursor.pos
 
         while n > 0:
-            text_after_cursor = "".join(
-                self._pad.canvas["char"][y, x : self._line_lengths[y]]
-            )
-            nchars_after_cursor = len(text_after_cursor)
-            if n <= nchars_after_cursor:
-                x += str_width(text_after_cursor[:n])
-                break
-
-            if y == self.end_text_point.y:
+            if self._line_is_ascii[y]:
+                nchars_after_cursor = self._line_lengths[y] - x
+                if n <= nchars_after_cursor:
+                    x += n
+                    break
+            else:
+                text_after_cursor = "".join(
+                    self._pad.canvas["char"][y, x : self._line_lengths[y]]
+                )
+                nchars_after_cursor = len(text_after_cursor)
+                if n <= nchars_after_cursor:
+                    x += str_width(text_after_cursor[:n])
+                    break
+
+            if y == self._end_text_point.y:
                 x = self._line_lengths[y]
                 break
 
@@ -617,65 +772,96 @@ class TextPad(Themable, Grabbable, Focusable, Gadget):
     def move_word_left(self):
         """Move cursor a word left."""
         self._last_x = None
-        last_x = self.cursor.x
-        first_char_found = False
+        y, x = self._cursor.pos
+        ll = self._line_lengths
+        chars = self._pad.canvas["char"]
+        row = chars[y, :x].tolist()
+        char_is_word_char = None  # Unknown until first non-space character.
         while True:
-            self.move_cursor_left()
-            if self.cursor.x == last_x:
+            if x == 0:
+                if y == 0:
+                    break
+                if ll[y - 1] == 0:
+                    y -= 1
+                    break
+                if char_is_word_char is not None:
+                    break
+                # Skip line break.
+                y -= 1
+                x = ll[y]
+                row = chars[y, :x].tolist()
+                continue
+
+            x -= 1
+            while x > 0 and row[x] == "":  # Skip to start of wide character.
+                x -= 1
+
+            current_char = row[x]
+            if current_char.isspace():
+                current_is_word_char = None
+            else:
+                current_is_word_char = current_char in _ASCII_WORD_CHARS or (
+                    current_char >= "\x80" and is_word_char(current_char)
+                )
+
+            if char_is_word_char is None:
+                char_is_word_char = current_is_word_char
+            elif current_is_word_char != char_is_word_char:
+                x += str_width(current_char)
                 break
 
-            last_x = self.cursor.x
-
-            current_char = self._pad.canvas[self.cursor]["char"]
-            if not first_char_found:
-                if not current_char.isspace():
-                    first_char_found = True
-                    char_is_word_char = is_word_char(current_char)
-            elif current_char.isspace() or char_is_word_char != is_word_char(
-                current_char
-            ):
-                self.move_cursor_right()
-                break
+        self.cursor = y, x
 
     def move_word_right(self):
         """Move cursor a word right."""
         self._last_x = None
-        last_x = self.cursor.x
-        first_char_found = False
+        y, x = self._cursor.pos
+        ll = self._line_lengths
+        chars = self._pad.canvas["char"]
+        # Include the blank cell after the line.
+        row = chars[y, : ll[y] + 1].tolist()
+        char_is_word_char = None  # Unknown until first non-space character.
         while True:
-            self.move_cursor_right()
-            if self.cursor.x == last_x:
-                break
+            if x == ll[y]:
+                if y == len(ll) - 1:
+                    break
+                y += 1
+                if x == 0:
+                    break
+                x = 0
+                row = chars[y, : ll[y] + 1].tolist()
+            else:
+                x += str_width(row[x]) or 1
 
-            last_x = self.cursor.x
+            current_char = row[x]
+            if current_char.isspace():
+                current_is_word_char = None
+            else:
+                current_is_word_char = current_char in _ASCII_WORD_CHARS or (
+                    current_char >= "\x80" and is_word_char(current_char)
+                )
 
-            current_char = self._pad.canvas[self.cursor]["char"]
-            if not first_char_found:
-                if not current_char.isspace():
-                    first_char_found = True
-                    char_is_word_char = is_word_char(current_char)
-            elif current_char.isspace() or char_is_word_char != is_word_char(
-                current_char
-            ):
+            if char_is_word_char is None:
+                char_is_word_char = current_is_word_char
+            elif current_is_word_char != char_is_word_char:
                 break
 
-    def _enter(self):
+        self.cursor = y, x
+
+    def _replace_selection(self, text: str):
+        """Replace selection with text as a single undoable edit."""
         self._move_undo_buffer_to_stack()
-        undos = []
-        if undo := self.delete_selection():
-            undos.append(undo)
-        undos.append(self._add_text(self.cursor, "\n"))
-        self._undo_stack.append(undos)
-        self._redo_stack.clear()
+        undo = self.delete_selection()
+        added = self._add_text(self.cursor, text)
+        self._undo_stack.append([undo, added] if undo else [added])
+        if self._redo_stack:
+            self._redo_stack.clear()
+
+    def _enter(self):
+        self._replace_selection("\n")
 
     def _tab(self):
-        self._move_undo_buffer_to_stack()
-        undos = []
-        if undo := self.delete_selection():
-            undos.append(undo)
-        undos.append(self._add_text(self.cursor, "    "))
-        self._undo_stack.append(undos)
-        self._redo_stack.clear()
+        self._replace_selection("    ")
 
     def _backspace(self):
         if self.has_nonempty_selection:
@@ -742,25 +928,17 @@ class TextPad(Themable, Grabbable, Focusable, Gadget):
     def _ctrl_d(self):
         """Select word."""
         self.unselect()
-        last_x = self.cursor.x
-        while True:
-            self.move_cursor_left()
-            if last_x == self.cursor.x:
-                break
-            if not is_word_char(self._pad.canvas[self.cursor]["char"]):
-                self.move_cursor_right()
-                break
-            last_x = self.cursor.x
-
+        self._last_x = None
+        y, x = self.cursor
+        is_word = _word_char_mask(self._pad.canvas["char"][y, : self._line_lengths[y]])
+        non_word = np.flatnonzero(~is_word)
+        i = np.searchsorted(non_word, x)
+        start = int(non_word[i - 1]) + 1 if i > 0 else 0
+        end = int(non_word[i]) if i < len(non_word) else len(is_word)
+
+        self.cursor = y, start
         self.select()
-        last_x = self.cursor.x
-        while True:
-            if not is_word_char(self._pad.canvas[self.cursor]["char"]):
-                break
-            self.move_cursor_right()
-            if last_x == self.cursor.x:
-                break
-            last_x = self.cursor.x
+        self.cursor = y, end
 
     def _up(self):
         if self.is_selecting:
@@ -858,7 +1036,16 @@ class TextPad(Themable, Grabbable, Focusable, Gadget):
             self._undo_buffer.append(self.delete_selection())
         elif self._undo_buffer_type != "add":
             self._move_undo_buffer_to_stack("add")
-        self._undo_buffer.append(self._add_text(self.cursor, key))
+
+        undo = self._add_text(self.cursor, key)
+        if self._undo_buffer:
+            # Extend the last addition if this key was typed right after it.
+            last_func, last_args, *_ = self._undo_buffer[-1]
+            start, end = undo[1]
+            if last_func == self._del_text and last_args[1] == start:
+                last_args[1] = end
+                return
+        self._undo_buffer.append(undo)
 
     __HANDLERS = {
         ("enter", False, False, False): _enter,
@@ -898,14 +1085,13 @@ class TextPad(Themable, Grabbable, Focusable, Gadget):
         if not self.is_focused:
             return super().on_key(key_event)
 
-        if (
-            not key_event.alt
-            and not key_event.ctrl
-            and not key_event.shift
-            and len(key_event.key) == 1
-        ):
-            self._ascii(key_event.key)
-        elif handler := self.__HANDLERS.get(astuple(key_event)):
+        key = key_event.key
+        alt = key_event.alt
+        ctrl = key_event.ctrl
+        shift = key_event.shift
+        if not (alt or ctrl or shift) and len(key) == 1:
+            self._ascii(key)
+        elif handler := self.__HANDLERS.get((key, alt, ctrl, shift)):
             handler(self)
         else:
             return super().on_key(key_event)
@@ -917,13 +1103,7 @@ class TextPad(Themable, Grabbable, Focusable, Gadget):
         if not self.is_focused:
             return
 
-        self._move_undo_buffer_to_stack()
-        undos = []
-        if undo := self.delete_selection():
-            undos.append(undo)
-        undos.append(self._add_text(self.cursor, paste_event.paste))
-        self._undo_stack.append(undos)
-        self._redo_stack.clear()
+        self._replace_selection(paste_event.paste)
 
         return True
 
@@ -947,9 +1127,12 @@ class TextPad(Themable, Grabbable, Focusable, Gadget):
         """Update selection on grab update."""
         if self._pad.collides_point(mouse_event.pos):
             y, x = self._pad.to_local(mouse_event.pos)
-            if y < len(self._line_lengths):
-                x = min(x, self._line_lengths[y])
-                self.cursor = y, x
+            line_lengths = self._line_lengths
+            if y < len(line_lengths):
+                x = min(x, line_lengths[y])
+                # Dragging within a cell doesn't move the cursor or the selection.
+                if (y, x) != self.cursor:
+                    self.cursor = y, x
         else:
             cy, cx = self.cursor
             y, x = self.to_local(mouse_event.pos)
@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 from collections.abc import Callable
-from dataclasses import astuple
 
 from numpy.typing import NDArray
 
@@ -787,14 +786,13 @@ class Textbox(Themable, Focusable, Grabbable, Gadget):
         if not self.is_focused:
             return super().on_key(key_event)
 
-        if (
-            not key_event.alt
-            and not key_event.ctrl
-            and not key_event.shift
-            and len(key_event.key) == 1
-        ):
-            self._ascii(key_event.key)
-        elif handler := self.__HANDLERS.get(astuple(key_event)):
+        key = key_event.key
+        alt = key_event.alt
+        ctrl = key_event.ctrl
+        shift = key_event.shift
+        if not (alt or ctrl or shift) and len(key) == 1:
+            self._ascii(key)
+        elif handler := self.__HANDLERS.get((key, alt, ctrl, shift)):
             handler(self)
         else:
             return super().on_key(key_event)
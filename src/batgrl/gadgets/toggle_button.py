@@ -221,6 +221,7 @@ class ToggleButton(Themable, ToggleButtonBehavior, Gadget):
         self._label = Text(
             pos_hint={"y_hint": 0.5, "anchor": "left"}, is_transparent=True
         )
+        self._label_text = None
         super().__init__(
             group=group,
             allow_no_selection=allow_no_selection,
@@ -256,6 +257,17 @@ class ToggleButton(Themable, ToggleButtonBehavior, Gadget):
     def alpha(self, alpha: float):
         self._pane.alpha = alpha
 
+    @property
+    def group(self) -> Hashable | None:
+        """If a group is provided, only one button in a group can be in the on state."""
+        return self._group
+
+    @group.setter
+    def group(self, group: Hashable | None):
+        self._group = group
+        if self._label_text is not None:
+            self.label = self._label_text
+
     @property
     def label(self) -> str:
         """Toggle button label."""
@@ -270,42 +282,46 @@ class ToggleButton(Themable, ToggleButtonBehavior, Gadget):
         else:
             on, off = TOGGLE_ON, TOGGLE_OFF
 
+        self._on_text = on + label
+        self._off_text = off + label
+        self._update_label()
+
+    def _update_label(self):
         if self.toggle_state == "on":
-            prefix = on
+            self._label.set_text(self._on_text)
         else:
-            prefix = off
-
-        self._label.set_text(prefix + label)
+            self._label.set_text(self._off_text)
 
     def update_theme(self):
         """Paint the gadget with current theme."""
         getattr(self, f"update_{self.button_state}")()
 
+    def _paint(self, colors):
+        fg, bg = colors
+        self._pane.bg_color = bg
+        self._label.canvas["fg_color"] = fg
+
     def update_normal(self):
         """Paint the normal state."""
-        self._pane.bg_color = self.color_theme.button_normal.bg
-        self._label.canvas["fg_color"] = self.color_theme.button_normal.fg
+        self._paint(self.color_theme.button_normal)
 
     def update_hover(self):
         """Paint the hover state."""
-        self._pane.bg_color = self.color_theme.button_hover.bg
-        self._label.canvas["fg_color"] = self.color_theme.button_hover.fg
+        self._paint(self.color_theme.button_hover)
 
     def update_down(self):
         """Paint the down state."""
-        self._pane.bg_color = self.color_theme.button_press.bg
-        self._label.canvas["fg_color"] = self.color_theme.button_press.fg
+        self._paint(self.color_theme.button_press)
 
     def update_disallowed(self):
         """Paint the disallowed state."""
-        self._pane.bg_color = self.color_theme.button_disallowed.bg
-        self._label.canvas["fg_color"] = self.color_theme.button_disallowed.fg
+        self._paint(self.color_theme.button_disallowed)
 
     def on_toggle(self):
         """Call callback on toggle state change."""
         if self.root is None:
             return
 
-        self.label = self.label  # Update radio button/checkbox
+        self._update_label()  # Update radio button/checkbox
         if self.callback is not None:
             self.callback(self.toggle_state)
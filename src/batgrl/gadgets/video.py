@@ -215,6 +215,7 @@ class Video(Graphics):
             is_enabled=is_enabled,
         )
         self._current_frame = None
+        self._resized_frame = None
         self._resource = None
         self._video_task = None
         self.source = source
@@ -272,11 +273,18 @@ class Video(Graphics):
         if self._current_frame is None or h == 0 or w == 0:
             return
 
-        self.texture = cv2.resize(
+        # Frames are kept in BGR and only converted to RGBA after they are resized
+        # to the (usually much smaller) texture. Both steps write into the previous
+        # frame's buffers; cv2 only allocates new ones if the size changed.
+        self._resized_frame = cv2.resize(
             self._current_frame,
             (w, 2 * h),
+            dst=self._resized_frame,
             interpolation=Interpolation._to_cv_enum[self.interpolation],
         )
+        self.texture = cv2.cvtColor(
+            self._resized_frame, cv2.COLOR_BGR2RGBA, dst=self.texture
+        )
 
     async def _play_video(self):
         if self._resource is None:
@@ -303,8 +311,7 @@ class Video(Graphics):
             except asyncio.CancelledError:
                 return
 
-            _, frame = self._resource.retrieve()
-            self._current_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGBA)
+            _, self._current_frame = self._resource.retrieve()
             self._display_current_frame()
 
     def on_size(self):
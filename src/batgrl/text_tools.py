@@ -1,7 +1,7 @@
 """Tools for text."""
 
 from bisect import bisect
-from functools import lru_cache
+from functools import cache, lru_cache
 from operator import itemgetter
 
 import numpy as np
@@ -28,17 +28,18 @@ __all__ = [
 
 VERTICAL_BLOCKS = " ▁▂▃▄▅▆▇█"
 HORIZONTAL_BLOCKS = " ▏▎▍▌▋▊▉█"
-_BRAILLE_ENUM = np.array([[1, 8], [2, 16], [4, 32], [64, 128]])
-_BOX_ENUM = np.array([[1, 4], [2, 8]])
+# Row and column of each dot of a braille character, from lowest to highest bit.
+_BRAILLE_BITS = [0, 1, 2, 0, 1, 2, 3, 3], [0, 0, 0, 1, 1, 1, 0, 1]
+_BOX_BITS = [0, 1, 0, 1], [0, 0, 1, 1]
 
-_vectorized_chr = np.vectorize(chr)
-"""Vectorized `chr`."""
+_BRAILLE_CHARS = np.array([chr(0x2800 + i) for i in range(256)])
+"""Braille characters indexed by their dot bits."""
 
-_vectorized_box_map = np.vectorize(" ▘▖▌▝▀▞▛▗▚▄▙▐▜▟█".__getitem__)
-"""Vectorized box enum to box char."""
+_BOX_CHARS = np.array(list(" ▘▖▌▝▀▞▛▗▚▄▙▐▜▟█"))
+"""Box characters indexed by their quadrant bits."""
 
 
-@lru_cache(maxsize=1024)
+@cache
 def char_width(char: str) -> int:
     """
     Return the column width of a character.
@@ -68,7 +69,6 @@ def char_width(char: str) -> int:
     return 1
 
 
-@lru_cache(maxsize=256)
 def str_width(chars: str) -> int:
     """
     Return the total column width of a string.
@@ -83,6 +83,15 @@ def str_width(chars: str) -> int:
     int
         The total column width of the string.
     """
+    # Every printable ascii character has width 1.
+    if chars.isascii() and chars.isprintable():
+        return len(chars)
+    return _str_width(chars)
+
+
+@lru_cache(maxsize=256)
+def _str_width(chars: str) -> int:
+    """Return the total column width of a string by summing character widths."""
     return sum(map(char_width, chars))
 
 
@@ -488,9 +497,8 @@ def binary_to_braille(array_4x2: NDArray[np.bool_]) -> NDArray[np.dtype("<U1")]:
     NDArray[np.dtype("<U1")]
         A numpy array of braille unicode characters.
     """
-    return _vectorized_chr(
-        np.sum(array_4x2 * _BRAILLE_ENUM, axis=(2, 3), initial=0x2800)
-    )
+    bits = array_4x2[..., *_BRAILLE_BITS]
+    return _BRAILLE_CHARS[np.packbits(bits, axis=-1, bitorder="little")[..., 0]]
 
 
 def binary_to_box(array_2x2: NDArray[np.bool_ | np.uint]) -> NDArray[np.dtype("<U1")]:
@@ -508,4 +516,5 @@ def binary_to_box(array_2x2: NDArray[np.bool_ | np.uint]) -> NDArray[np.dtype("<
     NDArray[np.dtype("<U1")]
         A numpy array of box unicode characters.
     """
-    return _vectorized_box_map(np.sum(array_2x2 * _BOX_ENUM, axis=(2, 3)))
+    bits = array_2x2[..., *_BOX_BITS]
+    return _BOX_CHARS[np.packbits(bits, axis=-1, bitorder="little")[..., 0]]
@@ -44,12 +44,11 @@ def read_texture(path: Path) -> NDArray[np.uint8]:
     elif image.dtype == np.dtype(np.float32):
         image = (image * 255).astype(np.uint8)
 
-    # Add an alpha channel if there isn't one.
-    h, w, c = image.shape
-    if c == 3:
-        default_alpha_channel = np.full((h, w, 1), 255, dtype=np.uint8)
-        image = np.dstack((image, default_alpha_channel))
-
+    # Images without an alpha channel have an opaque one added during conversion.
+    if image.ndim == 2:
+        return cv2.cvtColor(image, cv2.COLOR_GRAY2RGBA)
+    if image.shape[2] == 3:
+        return cv2.cvtColor(image, cv2.COLOR_BGR2RGBA)
     return cv2.cvtColor(image, cv2.COLOR_BGRA2RGBA)
 
 
@@ -77,6 +76,8 @@ def resize_texture(
     h, w = size
     if old_h == 0 or old_w == 0 or h == 0 or w == 0:
         return np.zeros((h, w, 4), np.uint8)
+    if old_h == h and old_w == w:
+        return texture.copy()
     return cv2.resize(
         texture,
         (w, h),